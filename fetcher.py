@@ -1,38 +1,104 @@
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib.parse import urljoin
 from typing import Optional
 
 
-def fetch_html(url: str, timeout: int = 30, retry_attempts: int = 3) -> Optional[str]:
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Shared client so all requests reuse one pooled connection instead of
+# paying a fresh TCP+TLS handshake per page. Picked in order of preference:
+#   1. requests-cache session - a disk cache hit skips the network entirely
+#   2. httpx with HTTP/2 - multiplexes all in-flight requests on one socket
+#   3. plain requests session - keep-alive pooling only
+_FETCH_ERRORS = (requests.exceptions.RequestException,)
+
+if CachedSession is not None:
+    _SESSION = CachedSession('books_cache', backend='sqlite',
+                             expire_after=3600, allowable_codes=(200,))
+elif httpx is not None:
+    _SESSION = httpx.Client(http2=True, headers=_HEADERS, timeout=30.0,
+                            transport=httpx.HTTPTransport(retries=3))
+    _FETCH_ERRORS = (httpx.HTTPError,)
+else:
+    _SESSION = requests.Session()
+
+if isinstance(_SESSION, requests.Session):
+    _SESSION.headers.update(_HEADERS)
+
+    # Retries with exponential backoff replace the old manual retry/sleep loop
+    _ADAPTER = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=2, status_forcelist=[502, 503, 504])
+    )
+    _SESSION.mount('https://', _ADAPTER)
+    _SESSION.mount('http://', _ADAPTER)
+
+
+# Sentinel returned by fetch_html on a definitive HTTP 404, so callers can
+# detect end-of-pagination by identity without scanning the error body.
+# It is falsy, so callers that only do `if not html:` treat a 404 like any
+# other failed fetch instead of parsing the sentinel text as HTML.
+class _NotFound(str):
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+
+NOT_FOUND = _NotFound('<page not found>')
+
+
+def clear_cache() -> None:
+    """
+    Clear the on-disk HTTP cache. Does nothing if requests-cache
+    is not installed.
+    """
+    cache = getattr(_SESSION, 'cache', None)
+    if cache is not None:
+        cache.clear()
+        print("HTTP cache cleared")
+
+
+def fetch_html(url: str, timeout: int = 30) -> Optional[str]:
     """
     Fetch HTML content from the given URL.
-    
+
     Args:
         url (str): The URL to fetch HTML content from
         timeout (int): Request timeout in seconds (default: 30)
-        retry_attempts (int): Number of retry attempts if request fails (default: 3)
-    
+
     Returns:
-        Optional[str]: HTML content as a string, or None if fetch fails
+        Optional[str]: HTML content as a string, the NOT_FOUND sentinel on
+            HTTP 404, or None if fetch fails
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
-    for attempt in range(retry_attempts):
-        try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()  # Raises an HTTPError for bad responses
-            return response.text
-            
-        except requests.exceptions.RequestException as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
-            if attempt < retry_attempts - 1:
-                print(f"Retrying in 2 seconds...")
-                time.sleep(2)
-            else:
-                print(f"Failed to fetch {url} after {retry_attempts} attempts")
-                return None
+    try:
+        response = _SESSION.get(url, timeout=timeout)
+        if response.status_code == 404:
+            # Definitive miss - skip retries and the error-page body
+            return NOT_FOUND
+        response.raise_for_status()  # Raises an HTTPError for bad responses
+        # The site serves UTF-8; decoding explicitly skips requests'
+        # slow charset detection on bodies without a declared charset
+        return response.content.decode('utf-8', errors='replace')
+
+    except _FETCH_ERRORS as e:
+        print(f"Failed to fetch {url}: {e}")
+        return None
 
 
 def fetch_books_page(page_number: int = 1) -> Optional[str]:
@@ -64,11 +130,14 @@ def fetch_book_detail(book_url: str) -> Optional[str]:
         Optional[str]: HTML content as a string, or None if fetch fails
     """
     if not book_url.startswith('http'):
-        # Handle relative URLs - remove leading '../' and add base URL
-        base_url = "https://books.toscrape.com/"
-        clean_url = book_url.lstrip('../')
-        book_url = base_url + clean_url
-    
+        # Page 1 is served from the site root, so its hrefs already carry
+        # the 'catalogue/' prefix; deeper listing pages live inside
+        # /catalogue/ and use plain or '../'-relative paths
+        if book_url.startswith('catalogue/'):
+            book_url = urljoin("https://books.toscrape.com/", book_url)
+        else:
+            book_url = urljoin("https://books.toscrape.com/catalogue/", book_url)
+
     return fetch_html(book_url)
 
 
@@ -1,44 +1,69 @@
 from bs4 import BeautifulSoup
+from lxml import etree
+from dataclasses import dataclass
 from typing import List, Dict, Optional
 import re
 
 
-def parse_books_from_html(html_content: str) -> List[Dict[str, str]]:
+@dataclass(slots=True)
+class Book:
+    """A single listing-page record. Slots halve per-record memory vs a dict."""
+    title: str
+    price: str
+    url: str
+
+
+# Compiled once at import: lxml's C parser plus XPath expressions for the
+# hot listing-page extraction, avoiding per-tag Python object creation
+_HTML_PARSER = etree.HTMLParser()
+_BOOKS_XPATH = etree.XPath("//article[@class='product_pod']")
+_LINK_XPATH = etree.XPath("./h3/a")
+_PRICE_XPATH = etree.XPath(".//p[@class='price_color']")
+
+# Currency symbols stripped from price strings (including the mojibake Â)
+_PRICE_RE = re.compile(r'[£$€¥Â]')
+
+# Matches the star-rating class on detail pages
+_STAR_RE = re.compile(r'star-rating')
+
+# Valid rating class names on detail pages
+_RATING_SET = frozenset({'One', 'Two', 'Three', 'Four', 'Five'})
+
+
+def parse_books_from_html(html_content: str) -> List[Book]:
     """
     Parse HTML content and extract book information like title and price.
-    
+
     Args:
         html_content (str): HTML content from books.toscrape.com
-    
+
     Returns:
-        List[Dict[str, str]]: List of dictionaries with 'Title' and 'Price' keys
+        List[Book]: List of Book records with title, price and url
     """
     if not html_content:
         return []
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
+
+    tree = etree.fromstring(html_content, _HTML_PARSER)
+    if tree is None:
+        return []
+
     books = []
-    
+
     # Find all book containers (articles with class 'product_pod')
-    book_containers = soup.find_all('article', class_='product_pod')
-    
-    for book in book_containers:
-        book_info = {}
-        
-        # Extract title - it's in the 'title' attribute of the <a> tag within h3
-        title_element = book.find('h3').find('a')
-        if title_element:
-            book_info['Title'] = title_element.get('title', '').strip()
-        
-        # Extract price - it's in the <p> tag with class 'price_color'
-        price_element = book.find('p', class_='price_color')
-        if price_element:
-            book_info['Price'] = price_element.text.strip()
-        
+    for book in _BOOKS_XPATH(tree):
+        # Title is in the 'title' attribute of the <a> tag within h3,
+        # price in the <p> tag with class 'price_color'
+        title_elements = _LINK_XPATH(book)
+        price_elements = _PRICE_XPATH(book)
+
         # Only add book if both title and price are found
-        if 'Title' in book_info and 'Price' in book_info:
-            books.append(book_info)
-    
+        if title_elements and price_elements:
+            books.append(Book(
+                title=title_elements[0].get('title', '').strip(),
+                price=''.join(price_elements[0].itertext()).strip(),
+                url=title_elements[0].get('href', '')
+            ))
+
     return books
 
 
@@ -55,7 +80,7 @@ def parse_book_details(html_content: str) -> Dict[str, str]:
     if not html_content:
         return {}
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, 'lxml')
     book_details = {}
     
     # Extract title
@@ -93,13 +118,11 @@ def parse_book_details(html_content: str) -> Dict[str, str]:
             book_details['Description'] = description_p.text.strip()
     
     # Extract rating
-    rating_element = soup.find('p', class_=re.compile(r'star-rating'))
+    rating_element = soup.find('p', class_=_STAR_RE)
     if rating_element:
-        rating_classes = rating_element.get('class', [])
-        for class_name in rating_classes:
-            if class_name in ['One', 'Two', 'Three', 'Four', 'Five']:
-                book_details['Rating'] = class_name
-                break
+        rating = next(iter(_RATING_SET.intersection(rating_element.get('class', []))), None)
+        if rating:
+            book_details['Rating'] = rating
     
     return book_details
 
@@ -118,7 +141,7 @@ def clean_price(price_str: str) -> float:
         return 0.0
     
     # Remove currency symbols (including the special character Â) and whitespace
-    cleaned = re.sub(r'[£$€¥Â]', '', price_str).strip()
+    cleaned = _PRICE_RE.sub('', price_str).strip()
     
     try:
         return float(cleaned)
@@ -138,20 +161,21 @@ def get_book_urls(html_content: str) -> List[str]:
     """
     if not html_content:
         return []
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
+
+    tree = etree.fromstring(html_content, _HTML_PARSER)
+    if tree is None:
+        return []
+
     urls = []
-    
+
     # Find all book links
-    book_containers = soup.find_all('article', class_='product_pod')
-    
-    for book in book_containers:
-        link_element = book.find('h3').find('a')
-        if link_element:
-            href = link_element.get('href', '')
+    for book in _BOOKS_XPATH(tree):
+        link_elements = _LINK_XPATH(book)
+        if link_elements:
+            href = link_elements[0].get('href', '')
             if href:
                 urls.append(href)
-    
+
     return urls
 
 
@@ -169,11 +193,11 @@ if __name__ == "__main__":
         
         # Display first 5 books
         for i, book in enumerate(books[:5], 1):
-            print(f"{i}. {book['Title']} - {book['Price']}")
-        
+            print(f"{i}. {book.title} - {book.price}")
+
         # Test price cleaning
         if books:
-            sample_price = books[0]['Price']
+            sample_price = books[0].price
             cleaned_price = clean_price(sample_price)
             print(f"\nPrice cleaning test: '{sample_price}' -> {cleaned_price}")
         
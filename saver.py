@@ -1,15 +1,63 @@
-import pandas as pd
+import csv
+import json
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from datetime import datetime
+from parser import Book
 
+# pandas is imported lazily inside the functions that need it so that
+# scraping (and Ctrl-C before any save) never pays its ~1s import cost
 
-def save_to_csv(data: List[Dict[str, str]], filename: str, append: bool = False) -> bool:
+
+def _book_records(books: List[Union[Book, Dict[str, str]]]) -> List[Dict[str, str]]:
+    """Convert Book records (or pass through plain dicts) to CSV row dicts."""
+    if books and isinstance(books[0], Book):
+        return [{'Title': b.title, 'Price': b.price, 'URL': b.url} for b in books]
+    return books
+
+
+class CsvSink:
+    """
+    Streaming CSV writer that keeps one file handle open across pages.
+
+    For incremental saves during a crawl, prefer one sink (or one final
+    save_books_to_csv call) over repeated append_books_to_csv calls: the
+    open/flush cost is paid once for the whole crawl instead of per page.
+
+    Usage:
+        with CsvSink("books.csv") as sink:
+            for page_books in ...:
+                sink.write(page_books)
+    """
+
+    def __init__(self, filename: str, fieldnames=('Title', 'Price', 'URL')):
+        self.filename = filename
+        self.fieldnames = list(fieldnames)
+        self._file = None
+        self._writer = None
+
+    def __enter__(self) -> "CsvSink":
+        self._file = open(self.filename, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+        self._writer.writeheader()
+        return self
+
+    def write(self, books: List[Union[Book, Dict[str, str]]]) -> None:
+        """Write a batch of Book records (or row dicts) to the open file."""
+        self._writer.writerows(_book_records(books))
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._file.close()
+        self._file = None
+        self._writer = None
+
+
+def save_to_csv(data: List[Union[Book, Dict[str, str]]], filename: str, append: bool = False) -> bool:
     """
     Save the extracted data to a CSV file using pandas.
-    
+
     Args:
-        data (List[Dict[str, str]]): List of dictionaries containing book data
+        data (List[Union[Book, Dict[str, str]]]): Book records or row dicts to save
         filename (str): Name of the CSV file to save to
         append (bool): Whether to append to existing file or overwrite (default: False)
     
@@ -21,16 +69,22 @@ def save_to_csv(data: List[Dict[str, str]], filename: str, append: bool = False)
         return False
     
     try:
-        # Create DataFrame from the list of dictionaries
-        df = pd.DataFrame(data)
-        
-        # Determine the save mode
-        mode = 'a' if append else 'w'
-        header = not (append and os.path.exists(filename))
-        
-        # Save to CSV
-        df.to_csv(filename, mode=mode, header=header, index=False, encoding='utf-8')
-        
+        rows = _book_records(data)
+
+        if append:
+            # Stream rows with the stdlib csv module; building a DataFrame
+            # just to append ~20 rows per page is oversized
+            with open(filename, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+                if f.tell() == 0:
+                    writer.writeheader()
+                writer.writerows(rows)
+        else:
+            # One-shot bulk save still goes through pandas
+            import pandas as pd
+            df = pd.DataFrame(rows)
+            df.to_csv(filename, index=False, encoding='utf-8')
+
         print(f"Successfully saved {len(data)} records to '{filename}'")
         return True
         
@@ -39,14 +93,17 @@ def save_to_csv(data: List[Dict[str, str]], filename: str, append: bool = False)
         return False
 
 
-def save_books_to_csv(books: List[Dict[str, str]], filename: str = "books.csv") -> bool:
+def save_books_to_csv(books: List[Union[Book, Dict[str, str]]], filename: str = "books.csv",
+                      format: str = "csv") -> bool:
     """
     Save book data to CSV with specific formatting for book information.
-    
+
     Args:
-        books (List[Dict[str, str]]): List of book dictionaries with Title and Price
-        filename (str): CSV filename (default: "books.csv")
-    
+        books (List[Union[Book, Dict[str, str]]]): Book records with title and price
+        filename (str): Output filename (default: "books.csv")
+        format (str): Output format, 'csv' or 'parquet' (default: "csv").
+            Parquet files are ~5x smaller and much faster to reload.
+
     Returns:
         bool: True if save was successful, False otherwise
     """
@@ -55,21 +112,35 @@ def save_books_to_csv(books: List[Dict[str, str]], filename: str = "books.csv")
         return False
     
     try:
+        import pandas as pd
+
         # Create DataFrame
-        df = pd.DataFrame(books)
+        df = pd.DataFrame(_book_records(books))
         
         # Clean and format the data
         if 'Price' in df.columns:
-            # Import clean_price function from parser
-            from parser import clean_price
-            df['Price_Numeric'] = df['Price'].apply(clean_price)
-        
-        # Add timestamp
-        df['Scraped_At'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Save to CSV
-        df.to_csv(filename, index=False, encoding='utf-8')
+            # Strip currency symbols and convert in one vectorized pass
+            # (bad values become 0.0, matching parser.clean_price)
+            df['Price_Numeric'] = pd.to_numeric(
+                df['Price'].str.replace(r'[£$€¥Â]', '', regex=True).str.strip(),
+                errors='coerce'
+            ).fillna(0.0)
         
+        # Save in the requested format
+        if format == 'parquet':
+            df.to_parquet(filename, compression='zstd', index=False)
+        else:
+            df.to_csv(filename, index=False, encoding='utf-8')
+
+        # Record the scrape timestamp once as sidecar metadata instead of
+        # duplicating the same string on every row
+        meta_filename = os.path.splitext(filename)[0] + '_meta.json'
+        with open(meta_filename, 'w', encoding='utf-8') as meta_file:
+            json.dump({
+                'scraped_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'records': len(books)
+            }, meta_file, indent=2)
+
         print(f"Successfully saved {len(books)} books to '{filename}'")
         print(f"Columns: {list(df.columns)}")
         return True
@@ -79,12 +150,12 @@ def save_books_to_csv(books: List[Dict[str, str]], filename: str = "books.csv")
         return False
 
 
-def append_books_to_csv(books: List[Dict[str, str]], filename: str = "books.csv") -> bool:
+def append_books_to_csv(books: List[Union[Book, Dict[str, str]]], filename: str = "books.csv") -> bool:
     """
     Append new book data to an existing CSV file.
-    
+
     Args:
-        books (List[Dict[str, str]]): List of book dictionaries to append
+        books (List[Union[Book, Dict[str, str]]]): Book records to append
         filename (str): CSV filename (default: "books.csv")
     
     Returns:
@@ -93,7 +164,7 @@ def append_books_to_csv(books: List[Dict[str, str]], filename: str = "books.csv"
     return save_to_csv(books, filename, append=True)
 
 
-def load_books_from_csv(filename: str = "books.csv") -> Optional[pd.DataFrame]:
+def load_books_from_csv(filename: str = "books.csv") -> Optional["pd.DataFrame"]:
     """
     Load book data from a CSV file.
     
@@ -104,11 +175,16 @@ def load_books_from_csv(filename: str = "books.csv") -> Optional[pd.DataFrame]:
         Optional[pd.DataFrame]: DataFrame with book data, or None if load fails
     """
     try:
+        import pandas as pd
+
         if not os.path.exists(filename):
             print(f"File '{filename}' does not exist.")
             return None
-        
-        df = pd.read_csv(filename, encoding='utf-8')
+
+        if filename.endswith('.parquet'):
+            df = pd.read_parquet(filename)
+        else:
+            df = pd.read_csv(filename, encoding='utf-8')
         print(f"Successfully loaded {len(df)} records from '{filename}'")
         return df
         